@@ -80,47 +80,270 @@ def colormaps(colors=vec(0, 0, 0), cmap='default'):
     Returns:
         vec: A vector representing RGB values in the range [0, 1].
 
+    Notes:
+        - Single-color wrapper around `colormap_values()`, which holds the actual
+          colormap definitions.
+    """
+    R, G, B = colormap_values([colors.x], [colors.y], [colors.z], cmap)
+    return vec(R[0], G[0], B[0])
+
+
+def colormap_values(x_values=[], y_values=[], z_values=[], cmap='default'):
+    """
+    Applies one colormap to whole lists of normalized values in a single call.
+
+    Parameters:
+        x_values (list of float): Inputs for the red channel, typically iteration-based
+                                  values normalized to [0, 1].
+        y_values (list of float): Inputs for the green channel, same length as x_values.
+        z_values (list of float): Inputs for the blue channel, same length as x_values.
+        cmap (str):               The name of the colormap to apply. Options include:
+                                  'spectral', 'inferno', 'viridis', 'plasma', or 'default'.
+
+    Returns:
+        tuple of lists: (R, G, B) channel lists with values in the range [0, 1].
+
     Colormap Notes:
         - Most colormaps are inspired by MATLAB's built-in visual styles.
         - 'spectral' is a custom, high-frequency psychedelic palette which I stumbled
           upon, trying to make these.
         - 'default' resembles a blue-to-orange gradient with a bright white midpoint and 
           deep blacks at the extremes, giving strong contrast and dynamic range.
+        - The colormap branch is chosen once per call rather than once per pixel.
+        - Channels are kept as separate plain-number lists; callers only build a `vec`
+          where a color is handed to VPython.
     """
     if cmap == 'spectral':
         # Custom high-frequency sinusoidal colormap for vivid, psychedelic transitions
-        R = abs(sin(100 * colors.x + 1))
-        G = sin(100 * colors.y + 2)
-        B = sin(100 * colors.z + 3)
-        return vec(R, G, B)
+        R = [abs(sin(100 * x + 1)) for x in x_values]
+        G = [sin(100 * y + 2) for y in y_values]
+        B = [sin(100 * z + 3) for z in z_values]
 
     elif cmap == 'inferno':
         # Deep warm red-yellow highlights 
-        R = sqrt(colors.x)
-        G = colors.y**2
-        B = -5 * (colors.z - 0.2)**2 + 0.2
-        return vec(R, G, B)
+        R = [sqrt(x) for x in x_values]
+        G = [y**2 for y in y_values]
+        B = [-5 * (z - 0.2)**2 + 0.2 for z in z_values]
 
     elif cmap == 'viridis':
         # Cool and smooth gradient with greenish mids and bluish lows
-        R = sin(colors.x + 0.5)**16
-        G = colors.y
-        B = -3 * (colors.z - 0.38)**2 + 0.6
-        return vec(R, G, B)
+        R = [sin(x + 0.5)**16 for x in x_values]
+        G = [y for y in y_values]
+        B = [-3 * (z - 0.38)**2 + 0.6 for z in z_values]
 
     elif cmap == 'plasma':
         # Bright purple-yellow transitions with nonlinearity for punch
-        R = sin(colors.x)
-        G = colors.y**10 + colors.y**(1/6) - 0.8
-        B = -colors.z + 1
-        return vec(R, G, B)
+        R = [sin(x) for x in x_values]
+        G = [y**10 + y**(1/6) - 0.8 for y in y_values]
+        B = [-z + 1 for z in z_values]
 
     else:  # cmap == 'default'
         # Blue-black to orange-black gradient with a white-hot center
-        R = sin(colors.x + 0.9)**30
-        G = sin(colors.y + 0.97)**80 * 0.9
-        B = -((colors.z + 0.5)**6 - 0.8)**2 + 1
-        return vec(R, G, B)
+        R = [sin(x + 0.9)**30 for x in x_values]
+        G = [sin(y + 0.97)**80 * 0.9 for y in y_values]
+        B = [-((z + 0.5)**6 - 0.8)**2 + 1 for z in z_values]
+
+    return R, G, B
+
+
+def escape_time(c_re, c_im, max_iter=100):
+    """
+    Counts how many iterations of Z_n+1 = Z_n^2 + C a point survives before escaping.
+
+    Parameters:
+        c_re (float):   Real part of the point C in the complex plane.
+        c_im (float):   Imaginary part of the point C in the complex plane.
+        max_iter (int): Iteration cap; points reaching it are treated as inside the set.
+
+    Returns:
+        int: The escape depth n in [0, max_iter].
+
+    Notes:
+        - Points inside the main cardioid or the period-2 bulb never escape, so they
+          are detected analytically and return max_iter without iterating. These two
+          regions cover most of the black area in zoomed-out views.
+    """
+    # Main cardioid test
+    c_im_sq = c_im * c_im
+    q = (c_re - 0.25) * (c_re - 0.25) + c_im_sq
+    if q * (q + (c_re - 0.25)) <= 0.25 * c_im_sq:
+        return max_iter
+
+    # Period-2 bulb test (disk of radius 1/4 centered at -1)
+    if (c_re + 1) * (c_re + 1) + c_im_sq <= 0.0625:
+        return max_iter
+
+    z_re, z_im = 0, 0
+    z_re_sq, z_im_sq = 0, 0  # Squared terms, shared by the escape test and the update
+    n = 0
+    # |Z| <= 2 is tested as |Z|^2 <= 4 to avoid a sqrt per iteration
+    while z_re_sq + z_im_sq <= 4 and n < max_iter:
+        # The imaginary part is updated first, while z_re still holds Z_n
+        z_im = 2 * z_re * z_im + c_im
+        z_re = z_re_sq - z_im_sq + c_re
+        z_re_sq = z_re * z_re
+        z_im_sq = z_im * z_im
+        n += 1
+
+    return n
+
+
+def two_sum(a, b):
+    """
+    Adds two floats without losing the rounding error (Knuth's TwoSum).
+
+    Returns:
+        list: [s, e] where s is the rounded sum and a + b == s + e exactly.
+    """
+    s = a + b
+    b_virtual = s - a
+    e = (a - (s - b_virtual)) + (b - b_virtual)
+    return [s, e]
+
+
+def two_prod(a, b):
+    """
+    Multiplies two floats without losing the rounding error (Dekker's TwoProduct).
+
+    Returns:
+        list: [p, e] where p is the rounded product and a * b == p + e exactly.
+
+    Notes:
+        - Each factor is split into two 26-bit halves so that the partial products are
+          exact. JavaScript has no fused multiply-add to do this in one step.
+    """
+    p = a * b
+    a_split = 134217729 * a  # 2^27 + 1
+    a_hi = a_split - (a_split - a)
+    a_lo = a - a_hi
+    b_split = 134217729 * b
+    b_hi = b_split - (b_split - b)
+    b_lo = b - b_hi
+    e = ((a_hi * b_hi - p) + a_hi * b_lo + a_lo * b_hi) + a_lo * b_lo
+    return [p, e]
+
+
+def dd_add(a_hi, a_lo, b_hi, b_lo):
+    """
+    Adds two double-double numbers (hi + lo pairs, ~106 bits of mantissa).
+
+    Returns:
+        list: [hi, lo] of the normalized sum.
+    """
+    s, e = two_sum(a_hi, b_hi)
+    e += a_lo + b_lo
+    hi = s + e
+    return [hi, e - (hi - s)]
+
+
+def dd_mul(a_hi, a_lo, b_hi, b_lo):
+    """
+    Multiplies two double-double numbers (hi + lo pairs, ~106 bits of mantissa).
+
+    Returns:
+        list: [hi, lo] of the normalized product.
+    """
+    p, e = two_prod(a_hi, b_hi)
+    e += a_hi * b_lo + a_lo * b_hi
+    hi = p + e
+    return [hi, e - (hi - p)]
+
+
+def reference_orbit(c_re, c_im, max_iter=100):
+    """
+    Records the full orbit Z_0, Z_1, ... of a single reference point C.
+
+    Parameters:
+        c_re (float):   Real part of the reference point.
+        c_im (float):   Imaginary part of the reference point.
+        max_iter (int): Maximum number of iterations to record.
+
+    Returns:
+        list: [orbit_re, orbit_im], two lists holding the real and imaginary parts of
+              Z_0 = 0 up to Z_max_iter, or up to the first value that escapes.
+
+    Notes:
+        - The orbit is iterated in double-double arithmetic and only rounded to float64
+          when stored. Rounding errors along a float64 orbit grow quickly near the
+          boundary of the set, and every pixel of a perturbed frame inherits them.
+        - Only one orbit is computed per frame, so the extra arithmetic is negligible
+          next to the per-pixel work, which stays in float64.
+    """
+    orbit_re, orbit_im = [0], [0]
+    z_re_hi, z_re_lo = 0, 0
+    z_im_hi, z_im_lo = 0, 0
+    n = 0
+    while n < max_iter:
+        # Z_n+1 = Z_n^2 + C, in double-double
+        z_re_sq_hi, z_re_sq_lo = dd_mul(z_re_hi, z_re_lo, z_re_hi, z_re_lo)
+        z_im_sq_hi, z_im_sq_lo = dd_mul(z_im_hi, z_im_lo, z_im_hi, z_im_lo)
+        cross_hi, cross_lo = dd_mul(z_re_hi, z_re_lo, z_im_hi, z_im_lo)
+
+        z_re_hi, z_re_lo = dd_add(z_re_sq_hi, z_re_sq_lo, -z_im_sq_hi, -z_im_sq_lo)
+        z_re_hi, z_re_lo = dd_add(z_re_hi, z_re_lo, c_re, 0)
+        z_im_hi, z_im_lo = dd_add(2 * cross_hi, 2 * cross_lo, c_im, 0)
+
+        orbit_re.append(z_re_hi)
+        orbit_im.append(z_im_hi)
+        n += 1
+
+        if z_re_hi * z_re_hi + z_im_hi * z_im_hi > 4:
+            break
+
+    return [orbit_re, orbit_im]
+
+
+def perturbed_escape_time(dc_re, dc_im, orbit_re, orbit_im, max_iter=100):
+    """
+    Counts escape iterations for the point C_ref + dC, iterated as an offset from a 
+    precomputed reference orbit (perturbation theory).
+
+    Parameters:
+        dc_re (float):           Real offset of the point from the reference point.
+        dc_im (float):           Imaginary offset of the point from the reference point.
+        orbit_re (list of float): Real parts of the reference orbit (see `reference_orbit()`).
+        orbit_im (list of float): Imaginary parts of the reference orbit.
+        max_iter (int):           Iteration cap; points reaching it are treated as inside the set.
+
+    Returns:
+        int: The escape depth n in [0, max_iter], matching `escape_time()`.
+
+    Notes:
+        - With Z_n = X_n + D_n, where X_n is the reference orbit, the offset obeys
+          D_n+1 = (2 X_n + D_n) D_n + dC. Only the small offsets have to be told apart
+          between neighbouring pixels, which float64 can do far below the zoom level at
+          which C itself stops being representable per pixel.
+        - When Z_n comes closer to 0 than the offset itself, or the reference orbit runs
+          out, the offset is rebased onto the start of the orbit (D = Z, X_0 = 0). This
+          keeps the offset small and avoids glitches when the reference escapes first.
+    """
+    d_re, d_im = 0, 0
+    m = 0                         # Position along the reference orbit
+    last_m = len(orbit_re) - 1
+    n = 0
+    while n < max_iter:
+        # D_n+1 = (2 X_n + D_n) D_n + dC
+        t_re = 2 * orbit_re[m] + d_re
+        t_im = 2 * orbit_im[m] + d_im
+        d_re_old = d_re
+        d_re = t_re * d_re - t_im * d_im + dc_re
+        d_im = t_re * d_im + t_im * d_re_old + dc_im
+        m += 1
+        n += 1
+
+        # Full value Z_n+1 = X_n+1 + D_n+1, used for the escape test
+        z_re = orbit_re[m] + d_re
+        z_im = orbit_im[m] + d_im
+        z_mag_sq = z_re * z_re + z_im * z_im
+        if z_mag_sq > 4:
+            return n
+
+        # Rebase onto the start of the reference orbit
+        if z_mag_sq < d_re * d_re + d_im * d_im or m == last_m:
+            d_re, d_im = z_re, z_im
+            m = 0
+
+    return max_iter
 
 
 def split(string=None, separator=' '):
@@ -139,25 +362,15 @@ def split(string=None, separator=' '):
         → ['apple', 'banana', 'pear']
 
     Notes:
-        - Does not handle consecutive separators the way Python's built-in split() does.
-        - This is a minimal version and does not support advanced behavior like regex or max splits.
+        - Consecutive separators produce empty strings, since the separator is always
+          passed explicitly (no whitespace collapsing).
+        - Thin wrapper around the built-in string split, which scans the string in one
+          native call instead of rebuilding each word character by character.
     """
     if string is None:
         return []
 
-    split_string = []
-    current_word = ''
-
-    for s in string:
-        if s == separator:
-            split_string.append(current_word)
-            current_word = ''
-        else:
-            current_word += s
-
-    # Append the final word after the loop ends
-    split_string.append(current_word)
-    return split_string
+    return string.split(separator)
 
 
 
@@ -188,7 +401,7 @@ def resize_box(evt):
     """
     global mouse_1_up, mandelbrot
 
-    if not mandelbrot.loaded:  # Wait until the Mandelbrot is fully rendered
+    if mandelbrot is None or not mandelbrot.loaded:  # Wait until the Mandelbrot is fully rendered
         return
 
     mouse_1_up = False
@@ -317,7 +530,7 @@ def recall_mandelbrot_dimensions(evt):
         - Dynamically updates the button background color to indicate availability.
     """
     global mandelbrot
-    if not mandelbrot.loaded:
+    if mandelbrot is None or not mandelbrot.loaded:
         return
     elif len(mandelbrot.dimensions_undo_list) == 1 and len(mandelbrot.dimensions_redo_list) == 0:
         # Nothing to undo or redo
@@ -370,7 +583,7 @@ def change_resolution(evt):
         - Applies the new resolution via `mandelbrot.change_parameters`.
     """
     global mandelbrot
-    if not mandelbrot.loaded:
+    if mandelbrot is None or not mandelbrot.loaded:
         return
 
     max_iter = mandelbrot.max_iter
@@ -394,25 +607,15 @@ def change_colormap(evt):
         evt (event): Event object with a `selected` field containing the new colormap name.
 
     Behavior:
-        - Keeps current resolution and max_iter.
-        - Pops the most recent image frame to preserve the viewport.
-        - Triggers a full redraw with the new colormap applied.
+        - Keeps the current viewport, resolution and max_iter.
+        - Recolors the existing image via `mandelbrot.recolor`, reusing the escape
+          depths of the last render instead of recomputing them.
     """
     global mandelbrot
-    if not mandelbrot.loaded:
+    if mandelbrot is None or not mandelbrot.loaded:
         return
 
-    max_iter = mandelbrot.max_iter
-    image_dimensions = mandelbrot.dimensions_undo_list.pop()
-    resolution = [mandelbrot.height, mandelbrot.width]
-    colormap = evt.selected
-
-    mandelbrot.change_parameters(
-        max_iter=max_iter,
-        image_dimensions=image_dimensions,
-        resolution=resolution,
-        colormap=colormap
-    )
+    mandelbrot.recolor(colormap=evt.selected)
 
 
 def change_search_depth(evt):
@@ -430,7 +633,7 @@ def change_search_depth(evt):
         - Re-renders with the new iteration depth.
     """
     global mandelbrot
-    if not mandelbrot.loaded:
+    if mandelbrot is None or not mandelbrot.loaded:
         return
 
     if evt.number < 1 or evt.number > 1000:
@@ -472,7 +675,7 @@ def change_image_dimensions(evt):
         evt: An event object passed by the winput field (must have a .text attribute).
     """
     global mandelbrot
-    if not mandelbrot.loaded:
+    if mandelbrot is None or not mandelbrot.loaded:
         return
 
     try:
@@ -547,6 +750,9 @@ class Mandelbrot:
         self.height = resolution[0]                    # Grid height
         self.width = resolution[1]                     # Grid width
         self.colormap = colormap                       # Selected color scheme
+        self.reference_orbit = None                    # Deep-zoom orbit of the view center
+        self.palettes = {}                             # Color lookup tables by colormap and depth
+        self.escape_counts = []                        # Escape depths of the rendered image
 
         # === Object Recycling Buffers ===
         # These are reused to minimize VPython object creation overhead
@@ -570,14 +776,127 @@ class Mandelbrot:
 
         Notes:
             - This method maps screen-space pixels to points in the complex plane.
+            - The image is built in vertical strips of `strip_width` columns. Each strip's
+            escape depths are computed by `__compute_escape_counts()` and drawn right
+            away, so the picture fills in progressively instead of all at once.
             - Instead of assigning positions in the complex plane directly (which can 
             lose precision in VPython's `vec`), pixel coordinates are mapped to a 
             normalized visual grid (e.g., [-80, 80] × [-60, 60]).
-            - Colors are mapped based on iteration counts using the selected colormap.
+            - Colors are mapped based on iteration counts using the selected colormap,
+            through a lookup table with one entry per escape depth.
             - Vertices are written to column buffers to construct quads on the fly.
         """
         self.loaded = False  # Disable interactions while building
 
+        # === Frame Setup ===
+        x_values, y_values = self.__map_pixels()
+        escape_counts = [-1] * (self.width * self.height)  # -1 marks a pixel not computed yet
+        palette = self.__load_palette()
+        strip_width = 32  # Columns computed and drawn per progressive step
+
+        # Loop invariants and object pools, bound to locals once per frame
+        height = self.height
+        half_width = self.width / 2
+        half_height = self.height / 2
+        existing_vertices = self.existing_vertices
+        rendered_vertices = self.rendered_vertices
+        existing_quads = self.existing_quads
+        rendered_quads = self.rendered_quads
+
+        # === Double Column Buffers for Quad Linking ===
+        current_col = [None] * self.height
+        previous_col = current_col[:]
+
+        # === Main Rendering Loop ===
+        for strip_start in range(0, self.width, strip_width):
+            strip_stop = min(strip_start + strip_width, self.width)
+            self.__compute_escape_counts(escape_counts, x_values, y_values, strip_start, strip_stop)
+
+            for px in range(strip_start, strip_stop):
+                column_start = px * height
+                for py in range(height):
+                    # Color assignment based on escape depth
+                    pixel_color = palette[escape_counts[column_start + py]]
+
+                    # Recycle a vertex and assign its position/color
+                    old_vertex = existing_vertices.pop()
+                    old_vertex.pos = vec(px - half_width, py - half_height, 0)
+                    old_vertex.color = pixel_color
+                    current_col[py] = old_vertex
+                    rendered_vertices.append(old_vertex)
+
+                    # Update quad connections using previous and current column buffers
+                    if px > 0 and py > 0:
+                        pixel = existing_quads.pop()
+                        pixel.v0 = current_col[py]
+                        pixel.v1 = current_col[py - 1]
+                        pixel.v2 = previous_col[py - 1]
+                        pixel.v3 = previous_col[py]
+                        pixel.visible = True
+                        rendered_quads.append(pixel)
+
+                # Roll current column to previous
+                previous_col = current_col[:]
+
+            # Show the image as soon as its first strip is in place
+            if strip_start == 0:
+                loading_text.visible = False
+                scene.range = self.height / 2
+            rate(60)  # Let the browser draw the finished strip
+
+        # === Finalization ===
+        self.escape_counts = escape_counts  # Kept for colormap-only redraws
+        self.loaded = True
+        scene.waitfor('draw_complete')  # Return once the finished image is on screen
+
+    def __load_palette(self):
+        """
+        Builds the color lookup table for the current colormap and iteration depth.
+
+        Returns:
+            list of vec: max_iter + 1 colors, where entry n is the color of a pixel
+                         with escape depth n. The last entry (inside the set) is black.
+
+        Notes:
+            - Escape depths are integers in [0, max_iter], so the colormap only ever
+            sees max_iter + 1 distinct inputs. Evaluating it once per depth instead of
+            once per pixel replaces H × W sin/pow evaluations with a list lookup.
+            - The table has one entry per depth rather than a fixed 256, so the
+            rendered colors are exactly the ones the colormap would produce.
+            - Tables are cached per (colormap, max_iter) pair. Zooming and undo/redo keep
+            both fixed, so most redraws reuse a table without evaluating the colormap.
+        """
+        palette_key = f'{self.colormap}:{self.max_iter}'
+        if palette_key in self.palettes:
+            return self.palettes[palette_key]
+
+        escape_ratios = [n / self.max_iter for n in range(self.max_iter)]
+        R, G, B = colormap_values(escape_ratios, escape_ratios, escape_ratios, self.colormap)
+
+        palette = [vec(R[n], G[n], B[n]) for n in range(self.max_iter)]
+        palette.append(vec(0, 0, 0))  # Inside set = black
+        self.palettes[palette_key] = palette
+        return palette
+
+    def __map_pixels(self):
+        """
+        Maps the pixel grid of the current view onto the complex plane.
+
+        Returns:
+            list: [x_values, y_values], the kernel input of each pixel column and row.
+
+        Notes:
+            - Every column shares one real part and every row one imaginary part, so
+            each axis is mapped to the complex plane once instead of once per pixel.
+            - Past a pixel spacing of 1e-12, pixels are computed by perturbation around
+            the orbit of the view center (see `perturbed_escape_time()`), which pushes
+            the zoom limit where the image breaks into blocks a few decades deeper.
+            In that case x_values and y_values hold offsets from the view center, and
+            the reference orbit is stored in `self.reference_orbit`.
+        """
+        width = self.width
+        height = self.height
+
         # === Derived Viewport Info ===
         center_x = (self.x_min + self.x_max) / 2
         center_y = (self.y_min + self.y_max) / 2
@@ -585,62 +904,149 @@ class Mandelbrot:
         view_height = self.y_max - self.y_min
 
         # Pixel-to-complex step size
-        zoom_x = view_width / self.width
-        zoom_y = view_height / self.height
+        zoom_x = view_width / width
+        zoom_y = view_height / height
+
+        # === Pixel-to-Complex Mapping ===
+        if min(zoom_x, zoom_y) < 1e-12:
+            # Deep zoom: neighbouring pixels are only a few float64 steps apart, so C
+            # itself can't be told apart per pixel. Pixels are iterated as offsets from
+            # the orbit of the view center instead.
+            self.reference_orbit = reference_orbit(center_x, center_y, self.max_iter)
+            x_values = [(px - width / 2) * zoom_x for px in range(width)]
+            y_values = [(py - height / 2) * zoom_y for py in range(height)]
+        else:
+            self.reference_orbit = None
+            x_values = [center_x + (px - width / 2) * zoom_x for px in range(width)]
+            y_values = [center_y + (py - height / 2) * zoom_y for py in range(height)]
 
-        # === Double Column Buffers for Quad Linking ===
-        current_col = [None] * self.height
-        previous_col = current_col[:]
+        return [x_values, y_values]
 
-        # === Main Rendering Loop ===
-        for px in range(self.width):
-            for py in range(self.height):
-                # Map pixel to complex plane
-                x = center_x + (px - self.width / 2) * zoom_x
-                y = center_y + (py - self.height / 2) * zoom_y
-
-                # Escape-time algorithm (Z_n+1 = Z_n^2 + C)
-                c_re, c_im = x, y
-                z_re, z_im = 0, 0
-                n = 0
-                while sqrt(z_re**2 + z_im**2) <= 2 and n < self.max_iter:
-                    z_re_old = z_re
-                    z_re = z_re_old * z_re_old - z_im * z_im + c_re
-                    z_im = 2 * z_re_old * z_im + c_im
-                    n += 1
-
-                # Color assignment based on escape depth
-                if n == self.max_iter:
-                    pixel_color = vec(0, 0, 0)  # Inside set = black
-                else:
-                    color_value = vec(1, 1, 1) * (n / self.max_iter)
-                    pixel_color = colormaps(colors=color_value, cmap=self.colormap)
-
-                # Recycle a vertex and assign its position/color
-                old_vertex = self.existing_vertices.pop()
-                old_vertex.pos = vec(px - self.width / 2, py - self.height / 2, 0)
-                old_vertex.color = pixel_color
-                current_col[py] = old_vertex
-                self.rendered_vertices.append(old_vertex)
-
-                # Update quad connections using previous and current column buffers
-                if px > 0 and py > 0:
-                    pixel = self.existing_quads.pop()
-                    pixel.v0 = current_col[py]
-                    pixel.v1 = current_col[py - 1]
-                    pixel.v2 = previous_col[py - 1]
-                    pixel.v3 = previous_col[py]
-                    pixel.visible = True
-                    self.rendered_quads.append(pixel)
-
-            # Roll current column to previous
-            previous_col = current_col[:]
+    def __compute_escape_counts(self, escape_counts, x_values, y_values, px_start, px_stop):
+        """
+        Runs the escape-time kernel over the pixel columns [px_start, px_stop).
 
-        # === Finalization ===
-        self.loaded = True
-        loading_text.visible = False
-        scene.range = self.height / 2
-        sleep(0.1)  # Allow VPython to visually update the scene
+        Parameters:
+            escape_counts (list of int): Column-major escape depths (index px * height + py),
+                                         -1 where not computed yet. Filled in place.
+            x_values (list of float):    Kernel input of each pixel column (see `__map_pixels()`).
+            y_values (list of float):    Kernel input of each pixel row.
+            px_start, px_stop (int):     Column range to compute (px_stop excluded).
+
+        Notes:
+            - The strip is filled by `__fill_rectangle()`, which skips iterating the
+            interior of regions whose border has a single escape depth.
+            - The Mandelbrot set is symmetric about the real axis. When the view is
+            centered on it (y_min == -y_max), row py is the exact mirror of row
+            height - py, so only the lower half (plus the axis row) is iterated.
+        """
+        height = self.height
+
+        # === Real-Axis Symmetry ===
+        symmetric = self.y_min == -self.y_max
+        computed_rows = height // 2 + 1 if symmetric else height
+
+        # === Strip Evaluation ===
+        self.__fill_rectangle(escape_counts, x_values, y_values, px_start, px_stop, 0, computed_rows)
+
+        # Mirror the computed half onto the rows above the real axis
+        for px in range(px_start, px_stop):
+            column_start = px * height
+            for py in range(computed_rows, height):
+                escape_counts[column_start + py] = escape_counts[column_start + height - py]
+
+    def __fill_rectangle(self, escape_counts, x_values, y_values, x0, x1, y0, y1):
+        """
+        Fills the escape depths of the pixel rectangle [x0, x1) × [y0, y1) using
+        Mariani-Silver subdivision.
+
+        Parameters:
+            escape_counts (list of int): Column-major escape depths, -1 where not computed yet.
+            x_values (list of float):    Kernel input of each pixel column (see `__pixel_escape_time()`).
+            y_values (list of float):    Kernel input of each pixel row.
+            x0, x1 (int):                Column range of the rectangle (x1 excluded).
+            y0, y1 (int):                Row range of the rectangle (y1 excluded).
+
+        Notes:
+            - Only the border of the rectangle is iterated. If every border pixel has the
+            same escape depth, the interior is filled with that depth without iterating.
+            This is exact for regions inside the set, since the set has no holes, and a
+            close approximation for the escape bands around it.
+            - Otherwise the rectangle is split in half along its longer side and both halves
+            are handled the same way. Rectangles with a side of `min_size` pixels or less
+            are iterated pixel by pixel.
+            - Pixels already computed (shared borders) are never iterated twice.
+        """
+        height = self.height
+        min_size = 16
+
+        # === Small Rectangles: Iterate Every Pixel ===
+        if x1 - x0 <= min_size or y1 - y0 <= min_size:
+            for px in range(x0, x1):
+                x_value = x_values[px]
+                column_start = px * height
+                for py in range(y0, y1):
+                    if escape_counts[column_start + py] < 0:
+                        escape_counts[column_start + py] = self.__pixel_escape_time(x_value, y_values[py])
+            return
+
+        # === Border Pass ===
+        border_pixels = []
+        for px in range(x0, x1):
+            border_pixels.append([px, y0])
+            border_pixels.append([px, y1 - 1])
+        for py in range(y0 + 1, y1 - 1):
+            border_pixels.append([x0, py])
+            border_pixels.append([x1 - 1, py])
+
+        border_value = -1
+        uniform_border = True
+        for border_pixel in border_pixels:
+            px, py = border_pixel[0], border_pixel[1]
+            i = px * height + py
+            if escape_counts[i] < 0:
+                escape_counts[i] = self.__pixel_escape_time(x_values[px], y_values[py])
+
+            if border_value < 0:
+                border_value = escape_counts[i]
+            elif escape_counts[i] != border_value:
+                uniform_border = False
+
+        # === Uniform Border: Fill the Interior ===
+        if uniform_border:
+            for px in range(x0 + 1, x1 - 1):
+                column_start = px * height
+                for py in range(y0 + 1, y1 - 1):
+                    escape_counts[column_start + py] = border_value
+            return
+
+        # === Mixed Border: Split Along the Longer Side ===
+        if x1 - x0 >= y1 - y0:
+            x_mid = (x0 + x1) // 2
+            self.__fill_rectangle(escape_counts, x_values, y_values, x0, x_mid, y0, y1)
+            self.__fill_rectangle(escape_counts, x_values, y_values, x_mid, x1, y0, y1)
+        else:
+            y_mid = (y0 + y1) // 2
+            self.__fill_rectangle(escape_counts, x_values, y_values, x0, x1, y0, y_mid)
+            self.__fill_rectangle(escape_counts, x_values, y_values, x0, x1, y_mid, y1)
+
+    def __pixel_escape_time(self, x_value, y_value):
+        """
+        Computes the escape depth of one pixel with the kernel chosen for this frame.
+
+        Parameters:
+            x_value (float): The pixel column's real part, or its real offset from the
+                             view center when a reference orbit is in use.
+            y_value (float): The pixel row's imaginary part, or its imaginary offset.
+
+        Returns:
+            int: The escape depth n in [0, max_iter].
+        """
+        if self.reference_orbit is None:
+            return escape_time(x_value, y_value, self.max_iter)
+
+        orbit_re, orbit_im = self.reference_orbit[0], self.reference_orbit[1]
+        return perturbed_escape_time(x_value, y_value, orbit_re, orbit_im, self.max_iter)
 
     def change_parameters(self, max_iter=100, image_dimensions=[-2, 0.5, -1, 1], resolution=[30, 45], colormap='default'):
         """
@@ -684,6 +1090,30 @@ class Mandelbrot:
         # === Render New Image ===
         self.__load_new_mandelbrot()
 
+    def recolor(self, colormap='default'):
+        """
+        Applies a new colormap to the current image without recomputing it.
+
+        Parameters:
+            colormap (str): Name of the color scheme to apply.
+
+        Notes:
+            - Escape depths only depend on the view, resolution and max_iter, so the
+            depths cached by the last render are looked up in the new color table.
+            This turns a colormap change from a full redraw into one pass over the vertices.
+            - `rendered_vertices` is filled in the same column-major order as
+            `escape_counts`, so both lists share an index.
+            - Vertex positions, quad links and the zoom history are left untouched.
+        """
+        self.loaded = False  # Disable interactions while recoloring
+        self.colormap = colormap
+        palette = self.__load_palette()
+
+        for i in range(len(self.rendered_vertices)):
+            self.rendered_vertices[i].color = palette[self.escape_counts[i]]
+
+        self.loaded = True
+
     def __recycle_old_vertices(self):
         """
         Moves all currently rendered vertices and quads into their respective reuse pools.
@@ -758,38 +1188,67 @@ class Mandelbrot:
         Notes:
             - This method avoids the overhead of creating objects on demand during rendering.
             - All objects are initialized with placeholder values and stored in recyclable lists.
-            - Quads are only allocated once for each 2×2 cell in the grid (i.e., (height - 1) × width).
+            - Quads are only allocated once for each 2×2 cell in the grid (i.e., (height - 1) × (width - 1)),
+            which is exactly the number the render loop draws.
             - The external `loading_text` object is assumed to be a VPython text label that provides 
             UI feedback and must be created before calling this method.
-            - A short sleep allows VPython to visually update the loading message before blocking.
+            - Blank quads point all four corners at the global `placeholder_vertex`, so they
+            don't depend on the vertices being created alongside them. The render loop
+            rebinds v0..v3 before a quad is made visible.
+            - `scene.waitfor('draw_complete')` returns as soon as the loading message has been
+            drawn, instead of guessing at the paint time with a fixed delay.
+            - Objects are created in chunks of `chunk_size` vertices with a one-frame yield
+            after each, so large presets (480×720) don't freeze the browser tab in one
+            long synchronous block.
         """
         scene.range = 10  # Reset scene zoom for clarity during loading
         loading_text.visible = True  # Show the "Loading..." label
-        sleep(0.1)  # Allow a visual update before intensive work begins
-
-        for i in range(fresh_load_size):
-            # Create a dummy vertex with neutral values
-            blank_vertex = vertex(
-                pos=vec(0, 0, 0),         # Temporary placeholder position
-                color=vec(0, 0, 0),       # Will be updated later in rendering
-                normal=vec(0, 0, 1),      # Default normal (perpendicular to screen)
+        scene.waitfor('draw_complete')  # Block until the label is actually drawn
+
+        # Allocate in chunks, yielding to the browser in between so the tab stays responsive
+        chunk_size = 8192
+        for chunk_start in range(0, fresh_load_size, chunk_size):
+            chunk_stop = min(chunk_start + chunk_size, fresh_load_size)
+            self.__load_fresh_chunk(chunk_stop - chunk_start)
+            rate(30)  # Yield one frame between chunks
+
+    def __load_fresh_chunk(self, chunk_load_size):
+        """
+        Creates one chunk of blank vertices, plus the quads the pool is still missing,
+        and adds them to the recycling pools.
+
+        Parameters:
+            chunk_load_size (int): Number of vertices to create in this chunk.
+        """
+        # Quads still missing from the pool, computed once instead of per vertex
+        n_quads = max(0, (self.height - 1) * (self.width - 1) - len(self.existing_quads))
+
+        # Create dummy vertices with neutral values
+        blank_vertices = [
+            vertex(
+                pos=zero_vector,          # Temporary placeholder position
+                color=zero_vector,        # Will be updated later in rendering
+                normal=screen_normal,     # Default normal (perpendicular to screen)
                 emmisive=True,           # Ensures color is unaffected by lighting
                 shininess=0              # No specular reflection
             )
-            self.existing_vertices.append(blank_vertex)
-
-            # Only create quads where needed (each quad spans a 2×2 vertex region)
-            if len(self.existing_quads) < (self.height - 1) * self.width:
-                blank_quad = quad(
-                    v0=blank_vertex,     # Temporarily use the same vertex for all corners
-                    v1=blank_vertex,
-                    v2=blank_vertex,
-                    v3=blank_vertex,
-                    visible=False        # Will be updated and made visible later
-                )
-                self.existing_quads.append(blank_quad)
+            for i in range(chunk_load_size)
+        ]
+
+        # Only create quads where needed (each quad spans a 2×2 vertex region)
+        blank_quads = [
+            quad(
+                v0=placeholder_vertex,   # Shared stand-in for all corners until rendering
+                v1=placeholder_vertex,
+                v2=placeholder_vertex,
+                v3=placeholder_vertex,
+                visible=False            # Will be updated and made visible later
+            )
+            for i in range(min(n_quads, chunk_load_size))
+        ]
 
-        sleep(0.01)  # Yield control so browser doesn't freeze during long allocation
+        self.existing_vertices.extend(blank_vertices)
+        self.existing_quads.extend(blank_quads)
 
 
 
@@ -809,6 +1268,11 @@ resolution_choices_str = [
     '30x45', '60x90', '120x180', '180x270', '240x360', '480x720'
 ]
 
+# Default search depth, viewing window [x_min, x_max, y_min, y_max] and its readout text
+default_max_iter = 100
+default_image_dimensions = [-2, 0.5, -1, 1]
+default_image_dimensions_str = '-2, 0.5, -1, 1'
+
 # Available colormaps supported by the project
 colormap_choices = ['default', 'inferno', 'viridis', 'spectral', 'plasma']
 
@@ -818,15 +1282,25 @@ mouse_1_up = True
 # Loading text indicator, hidden initially
 loading_text = text(text='Loading :)', align='center', color=color.white, visible=False)
 
-# Create the main Mandelbrot instance with a default mid-range resolution preset
-mandelbrot = Mandelbrot(resolution=resolution_choices[3])  # 120x160 pixels
+# Constant vectors shared by every pooled vertex (vertex() copies them on creation)
+zero_vector = vec(0, 0, 0)
+screen_normal = vec(0, 0, 1)  # Perpendicular to the screen
+
+# Single stand-in vertex for the corners of pooled quads that aren't rendered yet
+placeholder_vertex = vertex(pos=zero_vector, color=zero_vector, normal=screen_normal, emmisive=True, shininess=0)
+
+# Main Mandelbrot instance, built once the widgets are on screen (see end of file)
+mandelbrot = None
 
 
 # ============================== Interactive Widgets ===========================
+# Every widget is placed at the title anchor; look it up once for the whole section
+title_anchor = scene.title_anchor
+
 # Screenshot Button: Capture a PNG of the currently viewed Mandelbrot, named "mandelbrot_screenshot.png"
 screenshot_button = button(
     text='Screenshot',
-    pos=scene.title_anchor,
+    pos=title_anchor,
     background=color.white,
     bind=screen_capture
 )
@@ -834,10 +1308,10 @@ screenshot_button = button(
 # Undo Button: Step back to previous zoom/view parameters
 undo_dimension_change_button = button(
     text='Undo',
-    pos=scene.title_anchor,
+    pos=title_anchor,
     background=vec(0.8, 0.8, 0.8),   # Gray background (disabled look initially)
     bind=recall_mandelbrot_dimensions,  # Shared callback for undo/redo
-    button_title=wtext(text='  ', pos=scene.title_anchor),
+    button_title=wtext(text='  ', pos=title_anchor),
     redo=False,                     # Custom attribute: False for undo behavior
     pointer_to_redo=None            # Will be linked to redo button below
 )
@@ -845,10 +1319,10 @@ undo_dimension_change_button = button(
 # Redo Button: Step forward to a view undone previously
 redo_dimension_change_button = button(
     text='Redo',
-    pos=scene.title_anchor,
+    pos=title_anchor,
     background=vec(0.8, 0.8, 0.8),  # Gray background (disabled look initially)
     bind=recall_mandelbrot_dimensions,
-    button_title=wtext(text='  ', pos=scene.title_anchor),
+    button_title=wtext(text='  ', pos=title_anchor),
     redo=True,                      # Custom attribute: True for redo behavior
     pointer_to_undo=undo_dimension_change_button
 )
@@ -861,18 +1335,18 @@ undo_dimension_change_button.pointer_to_redo = redo_dimension_change_button
 colormap_menu = menu(
     choices=colormap_choices,
     selected=colormap_choices[0],  # Default: 'default'
-    pos=scene.title_anchor,
+    pos=title_anchor,
     bind=change_colormap,
-    menu_title=wtext(text='<b> Colormap:</b> ', pos=scene.title_anchor)
+    menu_title=wtext(text='<b> Colormap:</b> ', pos=title_anchor)
 )
 
 # Resolution selection dropdown menu
 image_resolution_menu = menu(
     choices=resolution_choices_str,
     selected=resolution_choices_str[3],  # Default: '120x160'
-    pos=scene.title_anchor,
+    pos=title_anchor,
     bind=change_resolution,
-    menu_title=wtext(text='<b> Resolution:</b> ', pos=scene.title_anchor)
+    menu_title=wtext(text='<b> Resolution:</b> ', pos=title_anchor)
 )
 
 # Numeric input widget for Mandelbrot iteration depth (search depth)
@@ -880,10 +1354,10 @@ mandel_search_depth_winput = winput(
     type='numeric',
     width=30,
     height=20,
-    text=mandelbrot.max_iter,
-    pos=scene.title_anchor,
+    text=default_max_iter,
+    pos=title_anchor,
     bind=change_search_depth,
-    title_wtext_obj=wtext(text='  <b>Depth:</b>', pos=scene.title_anchor),
+    title_wtext_obj=wtext(text='  <b>Depth:</b>', pos=title_anchor),
     suffix_wtext_obj=None,  # Populated below to add iteration label
     obj_type='winput'
 )
@@ -891,7 +1365,7 @@ mandel_search_depth_winput = winput(
 # Add "iterations" suffix label next to numeric input field
 mandel_search_depth_winput.suffix_wtext_obj = wtext(
     text=' iterations',
-    pos=scene.title_anchor
+    pos=title_anchor
 )
 
 # Create coordinate wtext readout for the current image center and zoom level
@@ -899,11 +1373,21 @@ dimensions_display_winput = winput(
     type='string',
     width=650,
     height=20,
-    text=f'{mandelbrot.x_min}, {mandelbrot.x_max}, {mandelbrot.y_min}, {mandelbrot.y_max}',
-    pos=scene.title_anchor,
+    text=default_image_dimensions_str,
+    pos=title_anchor,
     bind=change_image_dimensions,
     title_wtext_obj=wtext(
         text='\n<b>Current image dimensions (x min/max, y min/max):</b> ',
-        pos=scene.title_anchor
+        pos=title_anchor
     )
 )
+
+
+# ============================== Startup Render ================================
+# Create the main Mandelbrot instance with a default mid-range resolution preset.
+# Built last so the widgets are already drawn while its objects are allocated.
+mandelbrot = Mandelbrot(
+    max_iter=default_max_iter,
+    image_dimensions=default_image_dimensions,
+    resolution=resolution_choices[3]  # 180x270 pixels
+)